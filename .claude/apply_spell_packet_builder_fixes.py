@@ -14,6 +14,8 @@ def apply_fixes():
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    original_content = content
+
     # Fix 1: Add SpellHistory include (after SpellAuraEffects.h)
     content = content.replace(
         '#include "SpellAuraEffects.h"\n#include "SpellInfo.h"',
@@ -77,6 +79,12 @@ def apply_fixes():
         content
     )
 
+    # Skip the write when every fix was already applied, so a re-run does
+    # not touch the file and invalidate the incremental build
+    if content == original_content:
+        print("No changes needed - all fixes already applied")
+        return
+
     # Write the fixed file
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
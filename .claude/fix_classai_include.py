@@ -15,8 +15,19 @@ def fix_classai_include():
     old_includes = '#include "GridNotifiersImpl.h"\n\nnamespace Playerbot'
     new_includes = '#include "GridNotifiersImpl.h"\n#include "../../Packets/SpellPacketBuilder.h"  // PHASE 0 WEEK 3: Packet-based spell casting\n\nnamespace Playerbot'
 
+    if new_includes in content:
+        print("SpellPacketBuilder.h already included, skipping")
+        return True
+
+    original_content = content
     content = content.replace(old_includes, new_includes)
 
+    # Only rewrite the file when the include was actually inserted; an
+    # unconditional write would touch the timestamp and force a rebuild
+    if content == original_content:
+        print("ERROR: GridNotifiersImpl.h include anchor not found, no changes applied")
+        return False
+
     print(f"Writing fixed code to {file_path}...")
     with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
         f.write(content)
@@ -108,9 +108,8 @@ for file in "${FILES[@]}"; do
     fi
 
     # Add GameTime.h include after the last #include line
-    # Use a temporary file to avoid issues with in-place editing
-    awk '/^#include/ {last_include=NR} END {print last_include}' "$file" > /tmp/last_include_line
-    LAST_INCLUDE=$(cat /tmp/last_include_line)
+    # One awk pass locates it; no temporary file round trip is needed
+    LAST_INCLUDE=$(awk '/^#include/ {last_include=NR} END {print last_include}' "$file")
 
     if [ -n "$LAST_INCLUDE" ] && [ "$LAST_INCLUDE" -gt 0 ]; then
         # Insert #include "GameTime.h" after the last include
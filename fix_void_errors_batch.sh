@@ -34,26 +34,22 @@ for FILE in "${FILES[@]}"; do
         continue
     fi
 
-    # Count changes before
-    BEFORE=$(grep -c "return false;" "$FILE" 2>/dev/null || echo "0")
-    BEFORE=$((BEFORE + $(grep -c "return true;" "$FILE" 2>/dev/null || echo "0")))
-    BEFORE=$((BEFORE + $(grep -c "return nullptr;" "$FILE" 2>/dev/null || echo "0")))
-    BEFORE=$((BEFORE + $(grep -c "return 0;" "$FILE" 2>/dev/null || echo "0")))
-    BEFORE=$((BEFORE + $(grep -c "return {};" "$FILE" 2>/dev/null || echo "0")))
+    # Cheap gate: skip files without any standalone rewrite target so they are
+    # neither counted nor rewritten (sed -i touches the file even on no match)
+    if ! grep -qE '^\s*return (false|true|nullptr|0|\{\});$' "$FILE"; then
+        continue
+    fi
+
+    # Count changes before (one alternation pass instead of one grep per form;
+    # grep -c already prints 0 when nothing matches)
+    BEFORE=$(grep -cE 'return (false|true|nullptr|0|\{\});' "$FILE")
 
     # Apply fixes (only standalone return statements, not in expressions)
-    sed -i 's/^\(\s*\)return false;$/\1return;/g' "$FILE"
-    sed -i 's/^\(\s*\)return true;$/\1return;/g' "$FILE"
-    sed -i 's/^\(\s*\)return nullptr;$/\1return;/g' "$FILE"
-    sed -i 's/^\(\s*\)return 0;$/\1return;/g' "$FILE"
-    sed -i 's/^\(\s*\)return {};$/\1return;/g' "$FILE"
+    # One alternation rewrites every form in a single in-place pass
+    sed -i -E 's/^(\s*)return (false|true|nullptr|0|\{\});$/\1return;/' "$FILE"
 
     # Count changes after
-    AFTER=$(grep -c "return false;" "$FILE" 2>/dev/null || echo "0")
-    AFTER=$((AFTER + $(grep -c "return true;" "$FILE" 2>/dev/null || echo "0")))
-    AFTER=$((AFTER + $(grep -c "return nullptr;" "$FILE" 2>/dev/null || echo "0")))
-    AFTER=$((AFTER + $(grep -c "return 0;" "$FILE" 2>/dev/null || echo "0")))
-    AFTER=$((AFTER + $(grep -c "return {};;" "$FILE" 2>/dev/null || echo "0")))
+    AFTER=$(grep -cE 'return (false|true|nullptr|0|\{\});' "$FILE")
 
     CHANGES=$((BEFORE - AFTER))
 
@@ -7,7 +7,7 @@ OrderedRecursiveMutex acquisitions and verifies they are acquired in ascending
 order according to the LockOrder hierarchy defined in LockHierarchy.h.
 
 Usage:
-    python3 scripts/analyze_lock_order.py [--verbose] [--path PATH]
+    python3 scripts/analyze_lock_order.py [--verbose] [--path PATH] [--jobs N]
 
 Returns:
     0 if no violations found
@@ -23,10 +23,14 @@ Example output:
       - Lock SPATIAL_GRID (order 1000) acquired after THREAT_COORDINATOR (5000)
 """
 
+import os
 import re
 import sys
 import argparse
 from pathlib import Path
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
@@ -91,6 +95,22 @@ LOCK_HIERARCHY = {
     "TRINITYCORE_OBJECTMGR": 10200,
 }
 
+# std::lock_guard / std::unique_lock / std::shared_lock with OrderedMutex variants
+LOCK_GUARD_RE = re.compile(
+    r'std::(?:lock_guard|unique_lock|shared_lock)<(?:Playerbot::)?Ordered(?:Recursive)?(?:Shared)?Mutex<(?:Playerbot::)?LockOrder::(\w+)>>'
+)
+
+# Source file extensions scanned when walking the module tree
+CPP_EXTENSIONS = ('.cpp', '.h')
+
+# Directories pruned from the walk: VCS metadata, build output and IDE state
+SKIPPED_DIRECTORIES = {'.git', '.vs', 'build', 'out'}
+
+# Simple heuristic for function definitions: return_type function_name(...) {
+FUNCTION_START_RE = re.compile(
+    r'^\s*(?:[\w:]+\s+)+(\w+)\s*\([^)]*\)\s*(?:const\s*)?(?:override\s*)?{'
+)
+
 @dataclass
 class LockAcquisition:
     """Represents a lock acquisition in source code"""
@@ -116,75 +136,79 @@ class OrderingViolation:
         )
 
 
-def extract_lock_acquisitions(file_path: Path, verbose: bool = False) -> List[LockAcquisition]:
+def read_source(file_path: Path, verbose: bool = False) -> Optional[str]:
     """
-    Parse C++ file and extract all OrderedMutex lock acquisitions
-
-    Patterns detected:
-    - std::lock_guard<OrderedMutex<LockOrder::LOCK_NAME>>
-    - std::unique_lock<OrderedMutex<LockOrder::LOCK_NAME>>
-    - std::lock_guard<OrderedSharedMutex<LockOrder::LOCK_NAME>>
-    - std::lock_guard<OrderedRecursiveMutex<LockOrder::LOCK_NAME>>
-    - OrderedMutex<LockOrder::LOCK_NAME> _mutex; ... _mutex.lock()
+    Read a C++ source file once so every analysis pass can share its content
 
-    Returns list of LockAcquisition objects in the order they appear in the file
+    Returns None if the file cannot be read or decoded
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            return f.read()
     except (IOError, UnicodeDecodeError) as e:
         if verbose:
             print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
-        return []
+        return None
 
-    acquisitions: List[LockAcquisition] = []
-
-    # Pattern 1: std::lock_guard or std::unique_lock with OrderedMutex variants
-    lock_guard_pattern = r'std::(?:lock_guard|unique_lock|shared_lock)<(?:Playerbot::)?Ordered(?:Recursive)?(?:Shared)?Mutex<(?:Playerbot::)?LockOrder::(\w+)>>'
 
-    # Pattern 2: OrderedMutex member declaration
-    member_pattern = r'Ordered(?:Recursive)?(?:Shared)?Mutex<(?:Playerbot::)?LockOrder::(\w+)>\s+\w+;'
+def extract_lock_acquisitions(file_path: Path, content: str, verbose: bool = False) -> List[LockAcquisition]:
+    """
+    Parse C++ source content and extract all OrderedMutex lock acquisitions
 
-    # Pattern 3: Explicit .lock() calls
-    lock_call_pattern = r'(\w+)\.lock(?:_shared)?\(\)'
+    Patterns detected:
+    - std::lock_guard<OrderedMutex<LockOrder::LOCK_NAME>>
+    - std::unique_lock<OrderedMutex<LockOrder::LOCK_NAME>>
+    - std::lock_guard<OrderedSharedMutex<LockOrder::LOCK_NAME>>
+    - std::lock_guard<OrderedRecursiveMutex<LockOrder::LOCK_NAME>>
+    - OrderedMutex<LockOrder::LOCK_NAME> _mutex; ... _mutex.lock()
 
-    lines = content.split('\n')
+    Returns list of LockAcquisition objects in the order they appear in the file
+    """
+    acquisitions: List[LockAcquisition] = []
 
-    for line_num, line in enumerate(lines, start=1):
-        # Check for lock_guard/unique_lock
-        for match in re.finditer(lock_guard_pattern, line):
-            lock_name = match.group(1)
-            if lock_name in LOCK_HIERARCHY:
-                acquisitions.append(LockAcquisition(
-                    lock_name=lock_name,
-                    lock_order=LOCK_HIERARCHY[lock_name],
-                    line_number=line_num,
-                    line_content=line
-                ))
-            elif verbose:
-                print(f"Warning: Unknown lock order '{lock_name}' at {file_path}:{line_num}", file=sys.stderr)
+    # Every detected pattern names a LockOrder:: enumerator, so most files
+    # can be rejected with a substring test before any regex runs
+    if 'LockOrder::' not in content:
+        return acquisitions
+
+    # Scan the whole buffer in one finditer call instead of once per line; the
+    # pattern never spans a newline, so line numbers can be derived by
+    # counting newlines between consecutive matches
+    line_num = 1
+    scanned_to = 0
+
+    for match in LOCK_GUARD_RE.finditer(content):
+        start = match.start()
+        line_num += content.count('\n', scanned_to, start)
+        scanned_to = start
+
+        lock_name = match.group(1)
+        if lock_name in LOCK_HIERARCHY:
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+
+            acquisitions.append(LockAcquisition(
+                lock_name=lock_name,
+                lock_order=LOCK_HIERARCHY[lock_name],
+                line_number=line_num,
+                line_content=content[line_start:line_end]
+            ))
+        elif verbose:
+            print(f"Warning: Unknown lock order '{lock_name}' at {file_path}:{line_num}", file=sys.stderr)
 
     return acquisitions
 
 
-def extract_function_blocks(file_path: Path) -> Dict[str, Tuple[int, int]]:
+def extract_function_blocks(content: str) -> List[Tuple[str, int, int]]:
     """
     Extract function definitions and their line ranges
 
-    Returns dict mapping function names to (start_line, end_line) tuples
+    Returns list of (function_name, start_line, end_line) tuples in source order
     This helps identify which locks are acquired in the same function
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, UnicodeDecodeError):
-        return {}
-
-    functions: Dict[str, Tuple[int, int]] = {}
-
-    # Simple heuristic: Find function definitions
-    # Pattern: return_type function_name(...) {
-    func_pattern = r'^\s*(?:[\w:]+\s+)+(\w+)\s*\([^)]*\)\s*(?:const\s*)?(?:override\s*)?{'
+    functions: List[Tuple[str, int, int]] = []
 
     lines = content.split('\n')
     current_func = None
@@ -193,7 +217,7 @@ def extract_function_blocks(file_path: Path) -> Dict[str, Tuple[int, int]]:
 
     for line_num, line in enumerate(lines, start=1):
         # Check for function start
-        match = re.search(func_pattern, line)
+        match = FUNCTION_START_RE.search(line)
         if match and brace_depth == 0:
             current_func = match.group(1)
             func_start = line_num
@@ -201,7 +225,7 @@ def extract_function_blocks(file_path: Path) -> Dict[str, Tuple[int, int]]:
         elif current_func:
             brace_depth += line.count('{') - line.count('}')
             if brace_depth == 0:
-                functions[current_func] = (func_start, line_num)
+                functions.append((current_func, func_start, line_num))
                 current_func = None
 
     return functions
@@ -234,54 +258,73 @@ def check_ordering_in_function(acquisitions: List[LockAcquisition], verbose: boo
     return violations
 
 
-def analyze_file(file_path: Path, verbose: bool = False) -> List[OrderingViolation]:
+def analyze_file(file_path: Path, verbose: bool = False) -> Tuple[int, List[OrderingViolation]]:
     """
     Analyze a single C++ file for lock ordering violations
 
-    Returns list of violations found
+    The file is read once and shared by the acquisition and function passes
+
+    Returns (number of lock acquisitions, list of violations found)
     """
-    acquisitions = extract_lock_acquisitions(file_path, verbose)
+    content = read_source(file_path, verbose)
+    if content is None:
+        return 0, []
+
+    acquisitions = extract_lock_acquisitions(file_path, content, verbose)
 
     if len(acquisitions) < 2:
-        return []  # No violations possible with 0 or 1 locks
+        return len(acquisitions), []  # No violations possible with 0 or 1 locks
 
-    # Group acquisitions by function
-    functions = extract_function_blocks(file_path)
-    acquisitions_by_func: Dict[str, List[LockAcquisition]] = defaultdict(list)
+    # Group acquisitions by function (keyed by range index so overloads stay apart)
+    functions = extract_function_blocks(content)
+    func_starts = [start for _, start, _ in functions]
+    acquisitions_by_func: Dict[int, List[LockAcquisition]] = defaultdict(list)
 
     for acq in acquisitions:
-        # Find which function this acquisition belongs to
-        func_name = "global"
-        for fname, (start, end) in functions.items():
-            if start <= acq.line_number <= end:
-                func_name = fname
-                break
+        # Ranges are disjoint and sorted, so only the last one starting
+        # at or before this line can contain it
+        func_index = bisect_right(func_starts, acq.line_number) - 1
+        if func_index >= 0 and acq.line_number <= functions[func_index][2]:
+            acq.function_name = functions[func_index][0]
+        else:
+            func_index = -1
+            acq.function_name = "global"
 
-        acq.function_name = func_name
-        acquisitions_by_func[func_name].append(acq)
+        acquisitions_by_func[func_index].append(acq)
 
     # Check ordering within each function
     all_violations: List[OrderingViolation] = []
 
-    for func_name, func_acquisitions in acquisitions_by_func.items():
+    for func_acquisitions in acquisitions_by_func.values():
         violations = check_ordering_in_function(func_acquisitions, verbose)
         for violation in violations:
             violation.file_path = file_path
         all_violations.extend(violations)
 
-    return all_violations
+    return len(acquisitions), all_violations
 
 
 def find_cpp_files(root_path: Path) -> List[Path]:
     """
     Find all C++ source files in the PlayerBot module
 
+    Walks the tree once and filters by extension instead of globbing per pattern.
+    Backup, VCS and build directories are pruned so they are never descended
+    into and stale copies are never reported.
+
     Returns list of .cpp and .h file paths
     """
     cpp_files: List[Path] = []
 
-    for pattern in ['**/*.cpp', '**/*.h']:
-        cpp_files.extend(root_path.glob(pattern))
+    for dir_path, dir_names, file_names in os.walk(root_path):
+        dir_names[:] = [
+            d for d in dir_names
+            if d not in SKIPPED_DIRECTORIES and 'backup' not in d.lower()
+        ]
+
+        for file_name in file_names:
+            if file_name.endswith(CPP_EXTENSIONS):
+                cpp_files.append(Path(dir_path) / file_name)
 
     return sorted(cpp_files)
 
@@ -309,6 +352,12 @@ def main():
         nargs='+',
         help='Specific files to analyze (instead of scanning entire directory)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes used to analyze files (default: 1)'
+    )
 
     args = parser.parse_args()
 
@@ -329,35 +378,44 @@ def main():
     all_violations: List[Tuple[Path, List[OrderingViolation]]] = []
     files_with_locks = 0
 
-    for cpp_file in cpp_files:
-        violations = analyze_file(cpp_file, args.verbose)
+    # Files are analyzed independently, so they can be spread across worker
+    # processes; map() still yields results in file order for stable reports
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(analyze_file, cpp_files, repeat(args.verbose), chunksize=16))
+    else:
+        results = [analyze_file(cpp_file, args.verbose) for cpp_file in cpp_files]
+
+    for cpp_file, (lock_count, violations) in zip(cpp_files, results):
+        if lock_count:
+            files_with_locks += 1
 
         if violations:
             all_violations.append((cpp_file, violations))
-            files_with_locks += 1
-        else:
-            # Check if file has any lock acquisitions
-            acquisitions = extract_lock_acquisitions(cpp_file, verbose=False)
-            if acquisitions:
-                files_with_locks += 1
 
     # Report results
     if all_violations:
-        print("=" * 80)
-        print("LOCK ORDERING VIOLATIONS DETECTED")
-        print("=" * 80)
-        print()
+        # Collect the report and emit it in one write; a large report would
+        # otherwise cost one console flush per line
+        report: List[str] = [
+            "=" * 80,
+            "LOCK ORDERING VIOLATIONS DETECTED",
+            "=" * 80,
+            "",
+        ]
 
         for file_path, violations in all_violations:
-            print(f"{file_path}:")
+            report.append(f"{file_path}:")
             for violation in violations:
-                print(f"  - {violation}")
-            print()
+                report.append(f"  - {violation}")
+            report.append("")
+
+        report.append("=" * 80)
+        report.append(f"Summary: {len(all_violations)} files with violations, "
+                      f"{sum(len(v) for _, v in all_violations)} total violations")
+        report.append("=" * 80)
 
-        print("=" * 80)
-        print(f"Summary: {len(all_violations)} files with violations, "
-              f"{sum(len(v) for _, v in all_violations)} total violations")
-        print("=" * 80)
+        sys.stdout.write("\n".join(report) + "\n")
 
         return 1
     else: